@@ -1,7 +1,9 @@
+from io import BytesIO
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 
 # Set page configuration 
 st.set_page_config(
@@ -20,17 +22,190 @@ series_names = {
     "CES0500000003": "Average Hourly Earnings of All Employees"
 }
 
+# Reverse mapping for O(1) name -> series ID lookups
+name_to_id = {name: series_id for series_id, name in series_names.items()}
+
 # Load data function with caching for performance
 @st.cache_data
 def load_data():
-    return pd.read_csv('BLS_data.csv', parse_dates=['date'])
+    # pyarrow parses the CSV multi-threaded, much faster than the default C engine
+    data = pd.read_csv('BLS_data.csv', parse_dates=['date'], engine='pyarrow')
+    # BLS values and 4-digit years fit in narrow types; halving the bytes per
+    # row halves the memory scanned by every filter and aggregation
+    data['value'] = data['value'].astype('float32')
+    data['year'] = data['year'].astype('int16')
+    # Add a column for human-readable series names
+    data['series_name'] = data['series_id'].map(series_names).fillna('Unknown Series')  # Handle unmapped series
+    # Categorical dtype stores the 6 repeated labels as small integer codes,
+    # shrinking the columns and speeding up comparisons and groupby
+    data['series_id'] = data['series_id'].astype('category')
+    data['series_name'] = data['series_name'].astype('category')
+    # Pre-split the data per series so each section does a dict lookup
+    # instead of re-scanning the whole DataFrame on every rerun
+    by_id = {sid: sub.reset_index(drop=True) for sid, sub in data.groupby('series_id', sort=False, observed=True)}
+    # Enumerate the selectable series once here instead of re-scanning the
+    # column on every rerun; keep the order of the series_names mapping
+    present = set(data['series_name'].unique())
+    available_options = tuple(
+        name for name in list(series_names.values()) + ['Unknown Series'] if name in present
+    )
+    return data, by_id, available_options
 
 # Load the data
-data = load_data()
+data, by_id, available_options = load_data()
 
-# Add a column for human-readable series names
-data['series_name'] = data['series_id'].map(series_names)
-data['series_name'] = data['series_name'].fillna('Unknown Series')  # Handle unmapped series
+# Merge weekly hours and hourly earnings once per process instead of on every rerun
+@st.cache_data
+def build_hours_earnings(data):
+    hours = data.loc[data['series_id'] == 'CES0500000002', ['date', 'value']].set_index('date').rename(columns={'value': 'avg_weekly_hours'})
+    earnings = data.loc[data['series_id'] == 'CES0500000003', ['date', 'value']].set_index('date').rename(columns={'value': 'avg_hourly_earnings'})
+    # Both series share the same monthly date axis, so aligning on a shared
+    # DatetimeIndex avoids the hash-join a merge on 'date' would run
+    return pd.concat([hours, earnings], axis=1, join='inner').reset_index()
+
+merged_data = build_hours_earnings(data)
+
+# Shared Plotly config: drop the modebar UI the dashboard doesn't use to
+# trim what gets shipped and wired up on the client for each chart
+PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# Cap how many points each trace hands to Plotly; monthly data stays far
+# below this, but wider ranges or finer cadence won't blow up render time
+MAX_PLOT_POINTS = 2000
+
+def downsample(df):
+    if len(df) > MAX_PLOT_POINTS:
+        step = len(df) // MAX_PLOT_POINTS + 1
+        return df.iloc[::step]
+    return df
+
+# Cheap cache key for the plot slices: length plus first/last date pins down
+# a slice of the loaded data without hashing every row
+def _slice_key(df):
+    if len(df) == 0:
+        return (0, None, None)
+    return (len(df), df['date'].iat[0], df['date'].iat[-1])
+
+# Cache the finished figures so widget-only reruns skip trace and layout
+# construction and Streamlit can reuse the previous JSON payload
+@st.cache_data(hash_funcs={pd.DataFrame: _slice_key})
+def make_unemployment_fig(df):
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scattergl(
+            x=df['date'].dt.strftime('%Y-%m-%d').to_numpy(),
+            y=df['value'].to_numpy(),
+            mode='lines+markers',
+            name="Unemployment Rate",
+            line=dict(color='blue'),
+        )
+    )
+    fig.update_layout(
+        title="Unemployment Rate Over Time",
+        xaxis_title="Date",
+        yaxis_title="Unemployment Rate (%)",
+        template="plotly_white",
+        hovermode="x unified"
+    )
+    return fig
+
+@st.cache_data(hash_funcs={pd.DataFrame: _slice_key})
+def make_nonfarm_fig(df):
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scattergl(
+            x=df['date'].dt.strftime('%Y-%m-%d').to_numpy(),
+            y=df['value'].to_numpy(),
+            mode='lines+markers',
+            name="Total Nonfarm Workers",
+            line=dict(color='green'),
+        )
+    )
+    fig.update_layout(
+        title="Total Nonfarm Workers Over Time",
+        xaxis_title="Date",
+        yaxis_title="Workers (in thousands)",
+        template="plotly_white",
+        hovermode="x unified"
+    )
+    return fig
+
+@st.cache_data(hash_funcs={pd.DataFrame: _slice_key})
+def make_hours_earnings_fig(df):
+    dates = df['date'].dt.strftime('%Y-%m-%d').to_numpy()
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scattergl(
+            x=dates,
+            y=df['avg_weekly_hours'].to_numpy(),
+            mode='lines',
+            name="Average Weekly Hours",
+            line=dict(color='blue', width=2),
+            hovertemplate="Date: %{x}<br>Weekly Hours: %{y:.2f}<extra></extra>"
+        )
+    )
+    fig.add_trace(
+        go.Scattergl(
+            x=dates,
+            y=df['avg_hourly_earnings'].to_numpy(),
+            mode='lines',
+            name="Average Hourly Earnings",
+            line=dict(color='orange', width=2, dash='dot'),
+            hovertemplate="Date: %{x}<br>Hourly Earnings: $%{y:.2f}<extra></extra>"
+        )
+    )
+    fig.update_layout(
+        title="Weekly Hours and Hourly Earnings Trends",
+        xaxis=dict(
+            title="Date",
+            showgrid=True,
+            gridcolor='lightgray',
+            zeroline=False
+        ),
+        yaxis=dict(
+            title="Value",
+            showgrid=True,
+            gridcolor='lightgray',
+            zeroline=False
+        ),
+        legend=dict(
+            title="Metrics",
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        ),
+        hovermode="x unified",
+        template="simple_white"
+    )
+    return fig
+
+# Per-year totals for one series via a single reduceat pass over the sorted
+# values; cached, so reruns only add up a handful of precomputed floats
+@st.cache_data
+def year_sums(df):
+    sub = df.sort_values('year')
+    years = sub['year'].to_numpy()
+    values = np.ascontiguousarray(sub['value'].to_numpy())
+    uniq, offsets = np.unique(years, return_index=True)
+    sums = np.add.reduceat(values, offsets)
+    return dict(zip(uniq.tolist(), sums.tolist()))
+
+# Summary statistics keyed on the filter selection; a fused agg list skips
+# the quantile passes of describe() and repeats of the same filter are free
+@st.cache_data
+def summarize(data, ids, years):
+    sub = data[data['series_id'].isin(ids) & data['year'].between(years[0], years[1])]
+    return sub.groupby('series_name', observed=True)['value'].agg(['count', 'mean', 'std', 'min', 'median', 'max'])
+
+# Serialize the download CSV at most once per unique filter selection,
+# writing straight into a byte buffer so no intermediate str copy is held
+@st.cache_data
+def to_csv_bytes(df):
+    buf = BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
 
 
 
@@ -39,7 +214,7 @@ st.sidebar.header("Filters :mag: ")
 st.sidebar.write("Use the filters below to customize the dashboard.")
 
 # Dynamically assign defaults based on these series available options
-available_options = data['series_name'].unique()
+avail_set = set(available_options)
 default_options = ["Civilian Employment",
                    "Civilian Unemployment",
                    "Unemployment Rate",
@@ -47,7 +222,7 @@ default_options = ["Civilian Employment",
                    "Average Weekly Hours of All Employees",
                    "Average Hourly Earnings of All Employees"]
 
-default_options = [opt for opt in default_options if opt in available_options]
+default_options = [opt for opt in default_options if opt in avail_set]
 
 # Multiselect for series names
 selected_series_names = st.sidebar.multiselect(
@@ -73,14 +248,19 @@ st.sidebar.markdown(
 
 # Map selected series names back to series IDs
 selected_series_ids = [
-    series_id for series_id, name in series_names.items() if name in selected_series_names
+    name_to_id[name] for name in selected_series_names if name in name_to_id
 ]
 
+# Build the filter mask in one fused pass: isin runs on the categorical
+# codes, and pd.eval hands the year comparisons and the & to NumExpr so no
+# intermediate boolean arrays are allocated
+id_mask = data['series_id'].isin(selected_series_ids).to_numpy()
+year = data['year'].to_numpy()
+year_lo, year_hi = selected_years
+mask = pd.eval('id_mask & (year >= year_lo) & (year <= year_hi)')
+
 # Filter the data
-filtered_data = data[
-    (data['series_id'].isin(selected_series_ids)) &
-    (data['year'].between(selected_years[0], selected_years[1]))
-]
+filtered_data = data[mask]
 
 # Dashboard Title and Description
 st.markdown(
@@ -118,53 +298,19 @@ st.markdown(
 
 # Interactive Plot: Unemployment Rates
 st.subheader(" :chart_with_upwards_trend: Unemployment Rates")
-unemployment_data = filtered_data[filtered_data['series_id'] == 'LNS14000000']
-fig_unemployment = go.Figure()
-
-fig_unemployment.add_trace(
-    go.Scatter(
-        x=unemployment_data['date'],
-        y=unemployment_data['value'],
-        mode='lines+markers',
-        name="Unemployment Rate",
-        line=dict(color='blue'),
-    )
-)
+unemployment_data = by_id['LNS14000000']
+unemployment_data = downsample(unemployment_data[unemployment_data['year'].between(selected_years[0], selected_years[1])])
+fig_unemployment = make_unemployment_fig(unemployment_data)
 
-fig_unemployment.update_layout(
-    title="Unemployment Rate Over Time",
-    xaxis_title="Date",
-    yaxis_title="Unemployment Rate (%)",
-    template="plotly_white",
-    hovermode="x unified"
-)
-
-st.plotly_chart(fig_unemployment, use_container_width=True)
+st.plotly_chart(fig_unemployment, use_container_width=True, config=PLOTLY_CONFIG)
 
 # Interactive Plot: Total Nonfarm Workers
 st.subheader(":construction_worker: Number of Nonfarm Employment")
-nonfarm_data = filtered_data[filtered_data['series_id'] == 'CES0000000001']
-fig_nonfarm = go.Figure()
-
-fig_nonfarm.add_trace(
-    go.Scatter(
-        x=nonfarm_data['date'],
-        y=nonfarm_data['value'],
-        mode='lines+markers',
-        name="Total Nonfarm Workers",
-        line=dict(color='green'),
-    )
-)
-
-fig_nonfarm.update_layout(
-    title="Total Nonfarm Workers Over Time",
-    xaxis_title="Date",
-    yaxis_title="Workers (in thousands)",
-    template="plotly_white",
-    hovermode="x unified"
-)
+nonfarm_data = by_id['CES0000000001']
+nonfarm_data = downsample(nonfarm_data[nonfarm_data['year'].between(selected_years[0], selected_years[1])])
+fig_nonfarm = make_nonfarm_fig(nonfarm_data)
 
-st.plotly_chart(fig_nonfarm, use_container_width=True)
+st.plotly_chart(fig_nonfarm, use_container_width=True, config=PLOTLY_CONFIG)
 
 # COVID-19's Impact 
 st.markdown(
@@ -191,65 +337,9 @@ st.markdown(
 # Relationship between "Average Weekly Hours" and "Average Hourly Earnings"
 st.subheader(":timer_clock: :heavy_dollar_sign: Trends: Weekly Hours vs Hourly Earnings Over Time")
 
-hours_data = data[data['series_id'] == 'CES0500000002']
-earnings_data = data[data['series_id'] == 'CES0500000003']
-merged_data = pd.merge(
-    hours_data[['date', 'value']].rename(columns={'value': 'avg_weekly_hours'}),
-    earnings_data[['date', 'value']].rename(columns={'value': 'avg_hourly_earnings'}),
-    on='date'
-)
-
-fig = go.Figure()
-
-fig.add_trace(
-    go.Scatter(
-        x=merged_data['date'],
-        y=merged_data['avg_weekly_hours'],
-        mode='lines',
-        name="Average Weekly Hours",
-        line=dict(color='blue', width=2),
-        hovertemplate="Date: %{x}<br>Weekly Hours: %{y:.2f}<extra></extra>"
-    )
-)
-
-fig.add_trace(
-    go.Scatter(
-        x=merged_data['date'],
-        y=merged_data['avg_hourly_earnings'],
-        mode='lines',
-        name="Average Hourly Earnings",
-        line=dict(color='orange', width=2, dash='dot'),
-        hovertemplate="Date: %{x}<br>Hourly Earnings: $%{y:.2f}<extra></extra>"
-    )
-)
-
-fig.update_layout(
-    title="Weekly Hours and Hourly Earnings Trends",
-    xaxis=dict(
-        title="Date",
-        showgrid=True,
-        gridcolor='lightgray',
-        zeroline=False
-    ),
-    yaxis=dict(
-        title="Value",
-        showgrid=True,
-        gridcolor='lightgray',
-        zeroline=False
-    ),
-    legend=dict(
-        title="Metrics",
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="center",
-        x=0.5
-    ),
-    hovermode="x unified",
-    template="simple_white"
-)
+fig = make_hours_earnings_fig(downsample(merged_data))
 
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 
 # hours and wage text
@@ -271,13 +361,12 @@ st.markdown(
 # Pie Chart for Employment vs Unemployment 
 st.subheader("📊 Civilian Employment vs Civilian Unemployment")
 
-# Filter data based on the selected year range
-filtered_employment = data[(data['series_id'] == 'LNS12000000') & (data['year'].between(selected_years[0], selected_years[1]))]
-filtered_unemployment = data[(data['series_id'] == 'LNS13000000') & (data['year'].between(selected_years[0], selected_years[1]))]
-
-# Aggregate the total values over the selected year range
-employment_total = filtered_employment['value'].sum()
-unemployment_total = filtered_unemployment['value'].sum()
+# Aggregate the cached per-year sums over the selected year range
+employment_by_year = year_sums(by_id['LNS12000000'])
+unemployment_by_year = year_sums(by_id['LNS13000000'])
+year_range = range(selected_years[0], selected_years[1] + 1)
+employment_total = sum(employment_by_year.get(year, 0) for year in year_range)
+unemployment_total = sum(unemployment_by_year.get(year, 0) for year in year_range)
 
 # Create a DataFrame for the pie chart
 pie_data = pd.DataFrame({
@@ -285,7 +374,10 @@ pie_data = pd.DataFrame({
     "Value": [employment_total, unemployment_total]
 })
 
-# Create the pie chart
+# Create the pie chart; plotly.express is only needed here, so import it
+# lazily to keep its cost off the cold-start path
+import plotly.express as px
+
 fig_pie = px.pie(
     pie_data,
     names="Category",
@@ -296,7 +388,7 @@ fig_pie = px.pie(
 )
 
 # Display the pie chart
-st.plotly_chart(fig_pie, use_container_width=True)
+st.plotly_chart(fig_pie, use_container_width=True, config=PLOTLY_CONFIG)
 
 
 
@@ -319,17 +411,22 @@ st.markdown(
 
 # Summary Statistics
 st.subheader(":clipboard: Summary Statistics")
-summary = filtered_data.groupby('series_name')['value'].describe()
+summary = summarize(data, tuple(selected_series_ids), selected_years)
 st.dataframe(summary)
 
-# Data Table
+# Data Table - cap the rows serialized to the client; the download button
+# below still provides the full filtered data
+MAX_TABLE_ROWS = 5000
+
 st.subheader("📑Filtered Data Table")
-st.write(filtered_data)
+st.dataframe(filtered_data.head(MAX_TABLE_ROWS), use_container_width=True, height=400)
+if len(filtered_data) > MAX_TABLE_ROWS:
+    st.caption(f"Showing the first {MAX_TABLE_ROWS:,} of {len(filtered_data):,} rows. Download the full data below.")
 
 # Download button for filtered data
 st.download_button(
     label="⬇️ Download Filtered Data",
-    data=filtered_data.to_csv(index=False),
+    data=to_csv_bytes(filtered_data),
     file_name="filtered_bls_data.csv",
     mime="text/csv"
 )